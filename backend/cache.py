@@ -14,6 +14,10 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 from backend.database import get_supabase_client
+from backend.logging_config import get_logger
+
+# Get logger for this module
+logger = get_logger(__name__)
 
 # Path to config files (relative to project root)
 CONFIG_DIR = Path(__file__).parent.parent / "src" / "scholar_source" / "config"
@@ -181,7 +185,7 @@ def get_cached_analysis(
         
     except Exception as e:
         # If cache lookup fails, continue (don't break the app)
-        logger.warning(f"Cache lookup failed: {str(e)}")
+        logger.warning("Cache lookup failed: %s", e)
         return None
 
 
@@ -227,7 +231,7 @@ def set_cached_analysis(
 
     except Exception as e:
         # If cache storage fails, continue (don't break the app)
-        logger.error(f"Cache storage failed: {str(e)}")
+        logger.error("Cache storage failed: %s", e)
 
 
 def clear_cache_for_config_change() -> int:
@@ -258,7 +262,7 @@ def clear_cache_for_config_change() -> int:
         return deleted_count
         
     except Exception as e:
-        logger.warning(f"Cache cleanup failed: {str(e)}")
+        logger.warning("Cache cleanup failed: %s", e)
         return 0
 
 
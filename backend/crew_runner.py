@@ -20,7 +20,7 @@ from scholar_source.crew import ScholarSource
 from backend.jobs import update_job_status, get_job
 from backend.markdown_parser import parse_markdown_to_resources
 # Email service - COMMENTED OUT
-# from backend.email_service import send_results_email
+# from backend.email_service import queue_results_email
 from backend.cache import (
     get_cached_analysis,
     set_cached_analysis
@@ -79,7 +79,7 @@ def cancel_crew_job(job_id: str) -> bool:
     task = _active_tasks.get(job_id)
     if task and not task.done():
         task.cancel()
-        logger.info(f"Cancelled crew task for job {job_id}")
+        logger.info("Cancelled crew task for job %s", job_id)
         return True
     return False
 
@@ -96,7 +96,7 @@ async def _run_crew_worker(job_id: str, inputs: Dict[str, str], force_refresh: b
     # Check if job was cancelled before starting
     job = get_job(job_id)
     if job and job.get("status") == "cancelled":
-        logger.info(f"Job {job_id} was cancelled before execution started")
+        logger.info("Job %s was cancelled before execution started", job_id)
         return
 
     try:
@@ -138,8 +138,8 @@ async def _run_crew_worker(job_id: str, inputs: Dict[str, str], force_refresh: b
         )
 
         if cached_analysis:
-            logger.info(f"✅ CACHE HIT - Job {job_id}: Using cached course analysis")
-            logger.debug(f"Cache data: textbook_title={cached_analysis.get('textbook_title', 'N/A')}")
+            logger.info("✅ CACHE HIT - Job %s: Using cached course analysis", job_id)
+            logger.debug("Cache data: textbook_title=%s", cached_analysis.get('textbook_title', 'N/A'))
             update_job_status(
                 job_id,
                 status="running",
@@ -147,7 +147,7 @@ async def _run_crew_worker(job_id: str, inputs: Dict[str, str], force_refresh: b
             )
         else:
             cache_reason = "force_refresh=True" if force_refresh else "no cached data found"
-            logger.info(f"❌ CACHE MISS - Job {job_id}: Running fresh analysis ({cache_reason})")
+            logger.info("❌ CACHE MISS - Job %s: Running fresh analysis (%s)", job_id, cache_reason)
             update_job_status(
                 job_id,
                 status="running",
@@ -159,7 +159,7 @@ async def _run_crew_worker(job_id: str, inputs: Dict[str, str], force_refresh: b
         crew = crew_instance.crew()
 
         # Log that we're starting the crew
-        logger.info(f"🚀 Starting CrewAI execution for job {job_id}")
+        logger.info("🚀 Starting CrewAI execution for job %s", job_id)
 
         # Create async task for crew execution
         # Note: CrewAI's verbose=True uses print() statements, not logging
@@ -173,7 +173,7 @@ async def _run_crew_worker(job_id: str, inputs: Dict[str, str], force_refresh: b
             # Wait for crew to complete or be cancelled
             result = await crew_task
         except asyncio.CancelledError:
-            logger.info(f"Job {job_id} was cancelled during execution")
+            logger.info("Job %s was cancelled during execution", job_id)
             update_job_status(
                 job_id,
                 status="cancelled",
@@ -237,9 +237,12 @@ async def _run_crew_worker(job_id: str, inputs: Dict[str, str], force_refresh: b
 
             # Cache the results for future requests
             set_cached_analysis(normalized_inputs, analysis_results, cache_type="analysis")
-            logger.info(f"💾 CACHE STORED - Job {job_id}: Cached analysis for future use")
+            logger.info("💾 CACHE STORED - Job %s: Cached analysis for future use", job_id)
             if textbook_info:
-                logger.debug(f" Cached: title='{textbook_info.get('title', 'N/A')}', author='{textbook_info.get('author', 'N/A')}'")
+                logger.debug(
+                    " Cached: title='%s', author='%s'",
+                    textbook_info.get('title', 'N/A'), textbook_info.get('author', 'N/A')
+                )
 
         # Prepare metadata
         metadata = {
@@ -253,7 +256,7 @@ async def _run_crew_worker(job_id: str, inputs: Dict[str, str], force_refresh: b
         # Check if job was cancelled during execution
         job = get_job(job_id)
         if job and job.get("status") == "cancelled":
-            logger.info(f"Job {job_id} was cancelled during execution, discarding results")
+            logger.info("Job %s was cancelled during execution, discarding results", job_id)
             return
 
         # Update job with results
@@ -273,23 +276,23 @@ async def _run_crew_worker(job_id: str, inputs: Dict[str, str], force_refresh: b
         #     job = get_job(job_id)
         #     search_title = job.get('search_title', 'Your Search') if job else 'Your Search'
         #
-        #     # Send email (non-blocking, failure won't affect job status)
+        #     # Queue email for batched delivery (non-blocking, failure won't affect job status)
         #     try:
-        #         send_results_email(
+        #         queue_results_email(
         #             to_email=email,
         #             search_title=search_title,
         #             resources=resources,
         #             job_id=job_id
         #         )
         #     except Exception as email_error:
-        #         logger.warning(f"Failed to send email to {email}: {str(email_error)}")
+        #         logger.warning("Failed to queue email to %s: %s", email, email_error)
 
     except Exception as e:
         # Log error and update job
         error_message = str(e)
         stack_trace = traceback.format_exc()
 
-        logger.error(f"Job {job_id} failed: {error_message}")
+        logger.error("Job %s failed: %s", job_id, error_message)
         logger.error(stack_trace)
 
         update_job_status(
@@ -1,35 +1,180 @@
 """
 Supabase Database Client
 
-Initializes and provides access to the Supabase client for database operations.
+Provides lazy access to the Supabase client for database operations.
+The client is created on first use, so importing this module never
+opens a connection or requires credentials to be set.
+
+Also provides an asyncpg connection pool against the Supavisor pooler
+(transaction mode, port 6543) for latency-sensitive queries that should
+skip the PostgREST HTTP round-trip.
 """
 
 import os
+import time
+import asyncio
+import threading
+from typing import Optional
+import asyncpg
 from supabase import create_client, Client
 from dotenv import load_dotenv
+from backend.logging_config import get_logger
 
 # Load environment variables
 load_dotenv()
 
-# Get Supabase credentials from environment
-supabase_url = os.getenv("SUPABASE_URL")
-supabase_key = os.getenv("SUPABASE_ANON_KEY")
+# Get logger for this module
+logger = get_logger(__name__)
+
+# Minimum spacing between background attempts to create a missing pool,
+# and the time budget for each attempt
+PG_POOL_RETRY_INTERVAL_SECONDS = 30
+PG_POOL_RETRY_TIMEOUT_SECONDS = 10
+
+# Lazily-initialized Supabase client (see get_supabase_client)
+_client: Optional[Client] = None
+_client_lock = threading.Lock()
+
+# Direct Postgres pool, owned by the FastAPI lifespan (see get_pg_pool)
+_pg_pool: Optional[asyncpg.Pool] = None
+_pg_pool_lock = asyncio.Lock()
+_pg_pool_retry_task: Optional[asyncio.Task] = None
+_pg_pool_last_retry: Optional[float] = None
+
+
+def _create_supabase_client() -> Client:
+    """
+    Build a new Supabase client from environment credentials.
+
+    Returns:
+        Client: Supabase client for database operations
+
+    Raises:
+        ValueError: If SUPABASE_URL or SUPABASE_ANON_KEY is not set
+    """
+    supabase_url = os.getenv("SUPABASE_URL")
+    supabase_key = os.getenv("SUPABASE_ANON_KEY")
 
-if not supabase_url or not supabase_key:
-    raise ValueError(
-        "SUPABASE_URL and SUPABASE_ANON_KEY must be set in environment. "
-        "Check your .env file."
-    )
+    if not supabase_url or not supabase_key:
+        raise ValueError(
+            "SUPABASE_URL and SUPABASE_ANON_KEY must be set in environment. "
+            "Check your .env file."
+        )
 
-# Initialize Supabase client
-supabase: Client = create_client(supabase_url, supabase_key)
+    return create_client(supabase_url, supabase_key)
 
 
 def get_supabase_client() -> Client:
     """
-    Get the Supabase client instance.
+    Get the Supabase client instance, creating it on first use.
+
+    Uses double-checked locking so concurrent callers (e.g. crew worker
+    threads and request handlers) share a single client.
 
     Returns:
         Client: Supabase client for database operations
+
+    Raises:
+        ValueError: If Supabase credentials are missing from the environment
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _create_supabase_client()
+
+    return _client
+
+
+async def get_pg_pool() -> Optional[asyncpg.Pool]:
+    """
+    Get the asyncpg pool for the Supavisor pooler, creating it on first use.
+
+    The pool is bound to the event loop it was created on, so it should be
+    created from the FastAPI lifespan and only used by request handlers.
+    Statement caching is disabled because transaction-mode pooling does not
+    support prepared statements across transactions.
+
+    Returns:
+        asyncpg.Pool | None: Connection pool, or None if SUPABASE_DB_POOLER_URL
+        is not configured
     """
-    return supabase
+    global _pg_pool
+
+    if _pg_pool is None:
+        dsn = os.getenv("SUPABASE_DB_POOLER_URL")
+        if not dsn:
+            return None
+
+        # Concurrent first callers must not each build (and leak) a pool
+        async with _pg_pool_lock:
+            if _pg_pool is None:
+                _pg_pool = await asyncpg.create_pool(
+                    dsn=dsn,
+                    min_size=1,
+                    max_size=10,
+                    statement_cache_size=0,
+                    timeout=5  # Connect timeout, keeps startup bounded
+                )
+
+    return _pg_pool
+
+
+def get_existing_pg_pool() -> Optional[asyncpg.Pool]:
+    """
+    Get the asyncpg pool only if it has already been created.
+
+    Never connects, so callers with tight latency budgets (e.g. health
+    checks) can't end up paying for pool creation.
+
+    Returns:
+        asyncpg.Pool | None: Connection pool, or None if not created
+    """
+    return _pg_pool
+
+
+def schedule_pg_pool_retry() -> None:
+    """
+    Retry creating a missing asyncpg pool in the background.
+
+    Lets the pool recover after a failed startup attempt (e.g. a brief
+    pooler outage during a deploy) without making the caller wait. At most
+    one attempt runs at a time, and attempts are spaced by
+    PG_POOL_RETRY_INTERVAL_SECONDS. Must be called from the event loop.
+    """
+    global _pg_pool_retry_task, _pg_pool_last_retry
+
+    if _pg_pool is not None or not os.getenv("SUPABASE_DB_POOLER_URL"):
+        return
+    if _pg_pool_retry_task is not None and not _pg_pool_retry_task.done():
+        return
+    if (
+        _pg_pool_last_retry is not None
+        and time.monotonic() - _pg_pool_last_retry < PG_POOL_RETRY_INTERVAL_SECONDS
+    ):
+        return
+
+    _pg_pool_last_retry = time.monotonic()
+    _pg_pool_retry_task = asyncio.create_task(_retry_pg_pool())
+
+
+async def _retry_pg_pool() -> None:
+    """Attempt pool creation once, logging instead of raising on failure."""
+    try:
+        await asyncio.wait_for(get_pg_pool(), timeout=PG_POOL_RETRY_TIMEOUT_SECONDS)
+        logger.info("Postgres pool created after retry")
+    except Exception as e:
+        logger.warning("Postgres pool retry failed: %s", e)
+
+
+async def close_pg_pool() -> None:
+    """Cancel any pending pool retry and close the asyncpg pool if it was created."""
+    global _pg_pool
+
+    if _pg_pool_retry_task is not None and not _pg_pool_retry_task.done():
+        _pg_pool_retry_task.cancel()
+
+    if _pg_pool is not None:
+        await _pg_pool.close()
+        _pg_pool = None
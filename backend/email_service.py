@@ -2,12 +2,21 @@
 Email Service
 
 Handles sending email notifications when jobs complete.
-Uses Resend for email delivery.
+Uses the Resend HTTP API (via httpx) for email delivery.
+
+Completion emails are queued with queue_results_email() and sent in
+batches by a background thread, so jobs that finish close together share
+a single Resend API call and stay under its rate limit.
 """
 
 import os
-from typing import List, Dict, Any
-import resend
+import html
+import queue
+import string
+import threading
+import time
+from typing import List, Dict, Any, Optional
+import httpx
 from dotenv import load_dotenv
 from backend.logging_config import get_logger
 
@@ -16,6 +25,24 @@ load_dotenv()
 # Get logger for this module
 logger = get_logger(__name__)
 
+RESEND_API_URL = "https://api.resend.com"
+EMAIL_TIMEOUT_SECONDS = 10
+
+# Resend accepts at most 100 emails per batch request
+MAX_BATCH_SIZE = 100
+# How long the sender waits for more emails before flushing a batch
+BATCH_FLUSH_INTERVAL_SECONDS = float(os.getenv("EMAIL_BATCH_FLUSH_SECONDS", "2.0"))
+# Resend's default API rate limit (requests per second)
+RESEND_MAX_REQUESTS_PER_SECOND = float(os.getenv("RESEND_MAX_REQUESTS_PER_SECOND", "2"))
+
+# Pending emails, drained by the background sender thread
+_email_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+_sender_thread: Optional[threading.Thread] = None
+_sender_lock = threading.Lock()
+
+# Pooled client for synchronous sends (batch sender thread, scripts)
+_sync_client: Optional[httpx.Client] = None
+
 
 def send_results_email(
     to_email: str,
@@ -26,6 +53,8 @@ def send_results_email(
     """
     Send results email when job completes.
 
+    Blocks on the Resend API call - prefer queue_results_email() on hot paths.
+
     Args:
         to_email: Recipient email address
         search_title: User-friendly name for the search
@@ -36,85 +65,242 @@ def send_results_email(
         bool: True if email sent successfully, False otherwise
     """
     resend_api_key = os.getenv("RESEND_API_KEY")
-    from_email = os.getenv("FROM_EMAIL", "onboarding@resend.dev")
 
     # Skip if Resend not configured
     if not resend_api_key:
-        logger.warning(f"Resend API key not configured, skipping email to {to_email}")
+        logger.warning("Resend API key not configured, skipping email to %s", to_email)
         return False
 
-    # Set API key
-    resend.api_key = resend_api_key
-
     try:
-        # Build email HTML content
-        html_content = _build_email_html(search_title, resources, job_id)
-
         # Send email using Resend
-        params = {
-            "from": from_email,
-            "to": [to_email],
-            "subject": f"📚 Your ScholarSource Results: {search_title}",
-            "html": html_content,
-        }
-
-        response = resend.Emails.send(params)
+        params = _build_email_params(to_email, search_title, resources, job_id)
+        response = _get_sync_client().post(
+            f"{RESEND_API_URL}/emails",
+            json=params,
+            headers=_resend_headers(resend_api_key)
+        )
+        response.raise_for_status()
 
-        logger.info(f"Email sent successfully to {to_email} (ID: {response.get('id', 'unknown')})")
+        logger.info("Email sent successfully to %s (ID: %s)", to_email, response.json().get("id", "unknown"))
         return True
 
     except Exception as e:
-        logger.error(f"Error sending email to {to_email}: {str(e)}")
+        logger.error("Error sending email to %s: %s", to_email, e)
         return False
 
 
-def _build_email_html(
+def send_results_emails_batch(messages: List[Dict[str, Any]]) -> List[bool]:
+    """
+    Send several results emails using Resend's batch endpoint.
+
+    Args:
+        messages: List of dicts with to_email, search_title, resources and job_id
+            (the same arguments as send_results_email)
+
+    Returns:
+        list[bool]: Per-message success flags, in the same order as messages
+    """
+    resend_api_key = os.getenv("RESEND_API_KEY")
+
+    # Skip if Resend not configured
+    if not resend_api_key:
+        logger.warning("Resend API key not configured, skipping %d email(s)", len(messages))
+        return [False] * len(messages)
+
+    results = []
+    for start in range(0, len(messages), MAX_BATCH_SIZE):
+        chunk = messages[start:start + MAX_BATCH_SIZE]
+
+        try:
+            params_list = [_build_email_params(**message) for message in chunk]
+            response = _get_sync_client().post(
+                f"{RESEND_API_URL}/emails/batch",
+                json=params_list,
+                headers=_resend_headers(resend_api_key)
+            )
+            response.raise_for_status()
+
+            logger.info("Batch of %d email(s) sent successfully", len(chunk))
+            results.extend([True] * len(chunk))
+
+        except Exception as e:
+            logger.error(
+                "Error sending email batch to %s: %s",
+                ", ".join(message["to_email"] for message in chunk), e
+            )
+            results.extend([False] * len(chunk))
+
+    return results
+
+
+def queue_results_email(
+    to_email: str,
     search_title: str,
     resources: List[Dict[str, Any]],
     job_id: str
-) -> str:
+) -> None:
     """
-    Build HTML email content.
+    Queue a results email to be sent in the next batch.
+
+    Returns immediately; delivery happens on a background thread and
+    failures are logged rather than raised.
 
     Args:
+        to_email: Recipient email address
         search_title: User-friendly name for the search
         resources: List of discovered resources
         job_id: UUID of completed job
+    """
+    _ensure_sender_thread()
+    _email_queue.put({
+        "to_email": to_email,
+        "search_title": search_title,
+        "resources": resources,
+        "job_id": job_id
+    })
+
+
+def prewarm_email_client() -> None:
+    """
+    Open the pooled connection to Resend ahead of the first email.
+
+    Warms the same client the send path uses, so the first batch skips the
+    TCP/TLS handshake. Does nothing if Resend isn't configured.
+
+    Raises:
+        httpx.HTTPError: If Resend can't be reached
+    """
+    if not os.getenv("RESEND_API_KEY"):
+        return
+
+    _get_sync_client().head(RESEND_API_URL, timeout=2)
+
+
+def _get_sync_client() -> httpx.Client:
+    """
+    Get the shared synchronous HTTP client, creating it on first use.
 
     Returns:
-        str: HTML email content
+        httpx.Client: Pooled client for Resend API calls
     """
-    # Build resource list HTML
-    resources_html = ""
-    for resource in resources:
-        resource_type = resource.get("type", "Resource")
-        title = resource.get("title", "Untitled")
-        url = resource.get("url", "#")
-        source = resource.get("source", "Unknown")
-        description = resource.get("description", "")
+    global _sync_client
+
+    if _sync_client is None:
+        with _sender_lock:
+            if _sync_client is None:
+                _sync_client = httpx.Client(http2=True, timeout=EMAIL_TIMEOUT_SECONDS)
+
+    return _sync_client
+
+
+def _resend_headers(api_key: str) -> Dict[str, str]:
+    """Build authorization headers for the Resend API."""
+    return {"Authorization": f"Bearer {api_key}"}
+
 
-        resources_html += f"""
+def _ensure_sender_thread() -> None:
+    """Start the background batch sender if it isn't running yet."""
+    global _sender_thread
+
+    if _sender_thread is None:
+        with _sender_lock:
+            if _sender_thread is None:
+                _sender_thread = threading.Thread(
+                    target=_batch_sender_loop,
+                    name="email-batch-sender",
+                    daemon=True
+                )
+                _sender_thread.start()
+
+
+def _batch_sender_loop() -> None:
+    """
+    Drain the email queue forever, one batch at a time.
+
+    Waits for the first message, then collects more until the batch is full
+    or the flush interval elapses. Batch calls are spaced out to respect
+    Resend's per-second request limit.
+    """
+    min_interval = 1.0 / RESEND_MAX_REQUESTS_PER_SECOND
+    last_send = 0.0
+
+    while True:
+        batch = [_email_queue.get()]
+        deadline = time.monotonic() + BATCH_FLUSH_INTERVAL_SECONDS
+
+        while len(batch) < MAX_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_email_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        wait = last_send + min_interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+        try:
+            send_results_emails_batch(batch)
+        except Exception as e:
+            # Never let the sender thread die
+            logger.error("Email batch sender failed: %s", e)
+        last_send = time.monotonic()
+
+
+def _build_email_params(
+    to_email: str,
+    search_title: str,
+    resources: List[Dict[str, Any]],
+    job_id: str
+) -> Dict[str, Any]:
+    """
+    Build Resend send parameters for a results email.
+
+    Args:
+        to_email: Recipient email address
+        search_title: User-friendly name for the search
+        resources: List of discovered resources
+        job_id: UUID of completed job
+
+    Returns:
+        dict: JSON body for Resend's /emails endpoint (one item for /emails/batch)
+    """
+    return {
+        "from": os.getenv("FROM_EMAIL", "onboarding@resend.dev"),
+        "to": [to_email],
+        "subject": f"📚 Your ScholarSource Results: {search_title}",
+        "html": _build_email_html(search_title, resources, job_id),
+    }
+
+
+# Email templates are parsed once at import; all substituted values are HTML-escaped
+_RESOURCE_TPL = string.Template("""
         <div style="margin-bottom: 20px; padding: 15px; background-color: #f9fafb; border-left: 4px solid #3b82f6; border-radius: 4px;">
             <div style="margin-bottom: 8px;">
                 <span style="display: inline-block; padding: 4px 8px; background-color: #dbeafe; color: #1e40af; border-radius: 4px; font-size: 12px; font-weight: 600; margin-right: 8px;">
-                    {resource_type}
+                    $type
                 </span>
-                <strong style="font-size: 16px; color: #1f2937;">{title}</strong>
+                <strong style="font-size: 16px; color: #1f2937;">$title</strong>
             </div>
             <div style="margin-bottom: 8px;">
-                <a href="{url}" style="color: #3b82f6; text-decoration: none; word-break: break-all;">
-                    {url}
+                <a href="$url" style="color: #3b82f6; text-decoration: none; word-break: break-all;">
+                    $url
                 </a>
             </div>
             <div style="color: #6b7280; font-size: 14px;">
-                <strong>Source:</strong> {source}
+                <strong>Source:</strong> $source
             </div>
-            {f'<div style="margin-top: 8px; color: #4b5563; font-size: 14px;">{description}</div>' if description else ''}
+            $description
         </div>
-        """
+        """)
 
-    # Build full email HTML
-    html = f"""
+_DESCRIPTION_TPL = string.Template(
+    '<div style="margin-top: 8px; color: #4b5563; font-size: 14px;">$description</div>'
+)
+
+_EMAIL_TPL = string.Template("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -133,17 +319,17 @@ def _build_email_html(
             <!-- Search Title -->
             <div style="background-color: #eff6ff; padding: 20px; border-radius: 8px; margin-bottom: 30px;">
                 <h2 style="margin: 0 0 10px 0; font-size: 20px; color: #1e40af;">
-                    {search_title}
+                    $search_title
                 </h2>
                 <p style="margin: 0; color: #6b7280; font-size: 14px;">
-                    We found {len(resources)} resource{"s" if len(resources) != 1 else ""} for you
+                    We found $resource_count for you
                 </p>
             </div>
 
             <!-- Resources -->
             <div style="margin-bottom: 30px;">
                 <h3 style="margin: 0 0 20px 0; font-size: 18px; color: #1f2937;">Discovered Resources</h3>
-                {resources_html}
+                $resources_html
             </div>
 
             <!-- NotebookLM Tip -->
@@ -158,7 +344,7 @@ def _build_email_html(
             <!-- Footer -->
             <div style="text-align: center; padding-top: 20px; border-top: 1px solid #e5e7eb;">
                 <p style="margin: 0; color: #9ca3af; font-size: 12px;">
-                    Job ID: {job_id}
+                    Job ID: $job_id
                 </p>
                 <p style="margin: 10px 0 0 0; color: #9ca3af; font-size: 12px;">
                     This email was sent because you requested results from ScholarSource.
@@ -167,6 +353,47 @@ def _build_email_html(
         </div>
     </body>
     </html>
+    """)
+
+
+def _build_email_html(
+    search_title: str,
+    resources: List[Dict[str, Any]],
+    job_id: str
+) -> str:
     """
+    Build HTML email content.
 
-    return html
+    Args:
+        search_title: User-friendly name for the search
+        resources: List of discovered resources
+        job_id: UUID of completed job
+
+    Returns:
+        str: HTML email content
+    """
+    # Build resource list HTML
+    parts = []
+    for resource in resources:
+        description = resource.get("description") or ""
+
+        parts.append(_RESOURCE_TPL.substitute(
+            type=html.escape(resource.get("type") or "Resource"),
+            title=html.escape(resource.get("title") or "Untitled"),
+            url=html.escape(resource.get("url") or "#"),
+            source=html.escape(resource.get("source") or "Unknown"),
+            description=(
+                _DESCRIPTION_TPL.substitute(description=html.escape(description))
+                if description else ""
+            )
+        ))
+    resources_html = "".join(parts)
+
+    # Build full email HTML
+    count = len(resources)
+    return _EMAIL_TPL.substitute(
+        search_title=html.escape(search_title),
+        resource_count=f"{count} resource{'s' if count != 1 else ''}",
+        resources_html=resources_html,
+        job_id=html.escape(str(job_id))
+    )
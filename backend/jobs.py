@@ -68,7 +68,7 @@ def get_job(job_id: str) -> Optional[Dict[str, Any]]:
 
         return response.data[0]
     except Exception as e:
-        logger.error(f"Error fetching job {job_id}: {str(e)}")
+        logger.error("Error fetching job %s: %s", job_id, e)
         return None
 
 
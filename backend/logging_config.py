@@ -3,14 +3,46 @@ Centralized logging configuration for ScholarSource backend.
 
 This module sets up logging once and provides a simple get_logger() function
 that all backend modules can use.
+
+File logging is asynchronous: records are put on an in-memory queue and a
+background QueueListener thread writes them to a rotating log file, so
+request-handling threads never block on disk I/O. Console output stays
+synchronous.
+
+Convention: pass log arguments %-style instead of pre-formatting them, e.g.
+logger.debug("Job %s status: %s", job_id, status) rather than an f-string,
+so no formatting work is done when the level is disabled. For arguments
+that are themselves expensive to compute, use log_lazy() with callables.
+
+Set SCHOLAR_LOG=off (or pass log_level="OFF", e.g. via LOG_LEVEL=OFF) to skip
+handler setup entirely: only a NullHandler is installed and all logging is
+disabled. Useful for test_crew.py, unit tests, and CI.
 """
+import atexit
+import functools
 import logging
+import logging.handlers
+import os
+import queue
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Set
 
 # Global flag to ensure we only configure once
 _logging_configured = False
 
+# Background listener that performs file writes (None if file logging is off)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+# Rotate log files at 10 MB, keeping 3 backups
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 3
+
+# Default to ./logs directory in project root (relative to backend/)
+DEFAULT_LOG_DIR = Path(__file__).parent.parent / "logs"
+
+# Log directories already created, so reconfiguring (e.g. set_debug_mode) skips the mkdir
+_log_dirs_ready: Set[Path] = set()
+
 
 def configure_logging(
     log_level: str = "INFO",
@@ -27,27 +59,36 @@ def configure_logging(
     It preserves existing handlers and ensures CrewAI loggers are properly configured.
 
     Args:
-        log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
+        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, or OFF to disable)
         log_file: Name of log file (None to disable file logging)
         log_dir: Directory for log files (defaults to /logs in project root)
     """
-    global _logging_configured
+    global _logging_configured, _queue_listener
 
     if _logging_configured:
         return  # Already configured
 
+    # No-op fast path: skip all handler and file setup
+    if os.getenv("SCHOLAR_LOG", "").lower() == "off" or log_level.upper() == "OFF":
+        logging.getLogger().addHandler(logging.NullHandler())
+        logging.disable(logging.CRITICAL)
+        _logging_configured = True
+        return
+
+    # Resolve level once; unknown names fall back to INFO
+    level = logging._nameToLevel.get(log_level.upper(), logging.INFO)
+
     # Determine log directory
     if log_dir is None:
-        # Default to ./logs directory in project root (relative to backend/)
-        project_root = Path(__file__).parent.parent
-        log_dir = project_root / "logs"
+        log_dir = DEFAULT_LOG_DIR
 
     # Create log directory if it doesn't exist
-    if log_file:
+    if log_file and log_dir not in _log_dirs_ready:
         log_dir.mkdir(exist_ok=True, parents=True)
         # Verify directory was created
         if not log_dir.exists():
             raise OSError(f"Failed to create log directory: {log_dir}")
+        _log_dirs_ready.add(log_dir)
 
     # Configure logging ONLY for our application modules, not for CrewAI
     # CrewAI uses print() statements for verbose output, not logging
@@ -70,16 +111,29 @@ def configure_logging(
             )
             handlers.append(console_handler)
 
-        # File handler (optional) for our application logs
+        # File handler (optional) for our application logs, written by a
+        # background thread so callers only pay for a queue put
         if log_file:
-            file_handler = logging.FileHandler(log_dir / log_file)
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_dir / log_file,
+                maxBytes=LOG_FILE_MAX_BYTES,
+                backupCount=LOG_FILE_BACKUP_COUNT
+            )
             file_handler.setFormatter(
                 logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
             )
-            handlers.append(file_handler)
+
+            log_queue = queue.Queue(-1)
+            _queue_listener = logging.handlers.QueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            _queue_listener.start()
+            atexit.register(_stop_queue_listener)
+
+            handlers.append(logging.handlers.QueueHandler(log_queue))
 
         # Configure root logger level
-        root_logger.setLevel(getattr(logging, log_level.upper()))
+        root_logger.setLevel(level)
 
         # Add our handlers to the root logger
         for handler in handlers:
@@ -91,6 +145,21 @@ def configure_logging(
     _logging_configured = True
 
 
+def _stop_queue_listener() -> None:
+    """Flush pending file log records and stop the background listener."""
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_logger(name: str) -> logging.Logger:
+    """Memoized logging.getLogger (skips the logging module lock on repeat lookups)."""
+    return logging.getLogger(name)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for the given module.
@@ -113,7 +182,29 @@ def get_logger(name: str) -> logging.Logger:
     
     # Actually, let's just return the logger without configuring
     # The application should explicitly call configure_logging() if needed
-    return logging.getLogger(name)
+    return _cached_logger(name)
+
+
+def log_lazy(logger: logging.Logger, level: int, msg: str, *args: Any) -> None:
+    """
+    Log a message, skipping all argument work if the level is disabled.
+
+    Callable arguments are invoked only when the record will be emitted, so
+    expensive values (e.g. serializing a large payload) cost nothing at
+    disabled levels.
+
+    Usage:
+        log_lazy(logger, logging.DEBUG, "Results: %s", lambda: json.dumps(results))
+
+    Args:
+        logger: Logger to emit on
+        level: Logging level (e.g. logging.DEBUG)
+        msg: %-style format string
+        *args: Format arguments; callables are called to get their values
+    """
+    if not logger.isEnabledFor(level):
+        return
+    logger.log(level, msg, *(arg() if callable(arg) else arg for arg in args))
 
 
 # Convenience function for testing/debugging
@@ -6,8 +6,14 @@ Handles job submission and status polling.
 """
 
 import os
-from fastapi import FastAPI, HTTPException, Request
+import asyncio
+import hashlib
+from contextlib import asynccontextmanager
+from typing import Optional
+import fastapi
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from backend.models import (
     CourseInputRequest,
     JobSubmitResponse,
@@ -15,6 +21,14 @@ from backend.models import (
     HealthResponse
 )
 from backend.jobs import create_job, get_job
+from backend.database import (
+    get_supabase_client,
+    get_pg_pool,
+    get_existing_pg_pool,
+    schedule_pg_pool_retry,
+    close_pg_pool
+)
+from backend.email_service import prewarm_email_client
 from backend.crew_runner import run_crew_async, validate_crew_inputs
 from backend.logging_config import configure_logging, get_logger
 
@@ -29,29 +43,98 @@ configure_logging(
 logger = get_logger(__name__)
 logger.info("Starting ScholarSource API...")
 
+# Total time budget for the database probe in /api/health
+HEALTH_CHECK_DB_TIMEOUT_SECONDS = 2
+
+# FastAPI 0.130+ serializes response models straight to JSON bytes via Pydantic,
+# which is faster than ORJSONResponse (deprecated from 0.131). That fast path
+# only applies while the default response class is left unset, so orjson is
+# opted into on older releases only.
+_FASTAPI_VERSION = tuple(int(part) for part in fastapi.__version__.split(".")[:2])
+_RESPONSE_CLASS_KWARGS = (
+    {"default_response_class": ORJSONResponse} if _FASTAPI_VERSION < (0, 130) else {}
+)
+
+# Upper bound for the ?limit= page size on job results
+MAX_RESULTS_PAGE_SIZE = 500
+
+
+def _prewarm_sync_clients() -> None:
+    """
+    Build the lazily-initialized sync clients so the first request doesn't pay for it.
+
+    Each step is independent, so one failure (e.g. missing Supabase
+    credentials) doesn't skip the others.
+    """
+    try:
+        app.state.supabase = get_supabase_client()
+    except Exception as e:
+        logger.warning("Supabase client pre-warm failed: %s", e)
+
+    try:
+        # Imported here: crew_runner (imported above) puts src/ on sys.path
+        from scholar_source.tools.webpage_fetcher import WebPageFetcherTool
+
+        WebPageFetcherTool._get_session()
+        WebPageFetcherTool._get_cache()
+    except Exception as e:
+        logger.warning("Webpage fetcher pre-warm failed: %s", e)
+
+    try:
+        prewarm_email_client()
+    except Exception as e:
+        logger.warning("Resend connection pre-warm failed: %s", e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Initialize shared clients once per process and close them on shutdown.
+
+    Pre-warms the hot paths (Supabase client, Postgres pool, webpage
+    fetcher session, Resend connection) so the first request after a
+    deploy doesn't absorb every cold-start penalty. Failures are logged
+    but never block startup.
+    """
+    await asyncio.to_thread(_prewarm_sync_clients)
+
+    try:
+        await get_pg_pool()
+    except Exception as e:
+        # Don't block startup - health check reports the database as unavailable
+        # and retries pool creation in the background
+        logger.warning("Postgres pool initialization failed: %s", e)
+
+    yield
+
+    await close_pg_pool()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="ScholarSource API",
     description="Backend API for discovering educational resources aligned with course textbooks",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
+    **_RESPONSE_CLASS_KWARGS
 )
 
 # CORS configuration - allow frontend origins
+# Local dev servers (any port on localhost/127.0.0.1) match a regex that
+# Starlette compiles once; deployed origins are listed explicitly.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
-        "http://localhost:3000",  # Vite dev server (legacy port)
-        "http://127.0.0.1:3000",
-        "http://localhost:5173",  # Standard Vite port
-        "http://127.0.0.1:5173",
         "https://scholar-source.pages.dev",  # Cloudflare Pages
         # Add custom domain when configured:
         # "https://yourdomain.com",
     ],
+    allow_origin_regex=r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$",
     allow_credentials=True,
-    allow_methods=["GET", "POST", "OPTIONS"],  # OPTIONS required for CORS preflight
-    allow_headers=["*"],
-    expose_headers=["*"],
+    allow_methods=["GET", "POST"],  # Preflight (OPTIONS) is handled by the middleware itself
+    # ETag/If-None-Match let the frontend revalidate /api/status polls (304s)
+    allow_headers=["authorization", "content-type", "if-none-match"],
+    expose_headers=["ETag"],
 )
 
 
@@ -73,15 +156,35 @@ async def health_check():
 
     Returns API status and database connectivity.
     """
-    # Simplified health check for Railway startup
-    # Database check can cause timeout during container startup
+    # Database status never fails the health check - Railway uses this
+    # endpoint during container startup. Only the pool created by the
+    # lifespan is used, so a probe never waits on pool creation; if startup
+    # failed to create it, a retry is kicked off in the background instead.
+    pool = get_existing_pg_pool()
+    if pool is None:
+        schedule_pg_pool_retry()
+        database_status = "unavailable" if os.getenv("SUPABASE_DB_POOLER_URL") else "skipped"
+    else:
+        try:
+            await asyncio.wait_for(_ping_database(pool), timeout=HEALTH_CHECK_DB_TIMEOUT_SECONDS)
+            database_status = "connected"
+        except Exception as e:
+            logger.warning("Database health check failed: %s", e)
+            database_status = "unavailable"
+
     return {
         "status": "healthy",
         "version": "0.1.0",
-        "database": "skipped"
+        "database": database_status
     }
 
 
+async def _ping_database(pool) -> None:
+    """Run a trivial query on a pooled connection."""
+    async with pool.acquire() as conn:
+        await conn.fetchval("SELECT 1")
+
+
 @app.post("/api/submit", response_model=JobSubmitResponse, tags=["Jobs"])
 async def submit_job(request: CourseInputRequest):
     """
@@ -119,11 +222,11 @@ async def submit_job(request: CourseInputRequest):
         # Extract force_refresh from inputs (don't store in job inputs)
         force_refresh = inputs.pop('force_refresh', False)
 
-        logger.info(f"Creating new job with inputs: {inputs}")
+        logger.info("Creating new job with inputs: %s", inputs)
 
         # Create job in database
         job_id = create_job(inputs)
-        logger.info(f"Job created with ID: {job_id}")
+        logger.info("Job created with ID: %s", job_id)
 
         # Start background crew execution (pass force_refresh separately)
         run_crew_async(job_id, inputs, force_refresh=force_refresh)
@@ -135,7 +238,7 @@ async def submit_job(request: CourseInputRequest):
         }
 
     except Exception as e:
-        logger.error(f"Job creation failed: {str(e)}", exc_info=True)
+        logger.error("Job creation failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail={
@@ -146,15 +249,24 @@ async def submit_job(request: CourseInputRequest):
 
 
 @app.get("/api/status/{job_id}", response_model=JobStatusResponse, tags=["Jobs"])
-async def get_job_status(job_id: str):
+async def get_job_status(
+    job_id: str,
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_RESULTS_PAGE_SIZE, description="Max resources to return"),
+    offset: int = Query(0, ge=0, description="Number of resources to skip")
+):
     """
     Get the current status of a job.
 
     Poll this endpoint to check job progress and retrieve results
-    when the job completes.
+    when the job completes. Responses carry an ETag; send it back in
+    If-None-Match to get an empty 304 when nothing has changed.
 
     Args:
         job_id: UUID of the job
+        limit: Maximum number of resources to return (default: all)
+        offset: Number of resources to skip
 
     Returns:
         JobStatusResponse: Current job status and results (if completed)
@@ -173,15 +285,31 @@ async def get_job_status(job_id: str):
             }
         )
 
+    # Skip serializing the response if the client already has this version
+    etag = _job_etag(job, limit, offset)
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"  # Always revalidate, never serve blind
+
     # Extract relevant input fields for display
     inputs = job.get("inputs", {})
-    
+
+    # Paginate results server-side
+    results = job.get("results")
+    results_total = len(results) if results is not None else None
+    if results is not None:
+        end = offset + limit if limit is not None else None
+        results = results[offset:end]
+
     return {
         "job_id": job["id"],
         "status": job["status"],
         "status_message": job.get("status_message"),
         "search_title": job.get("search_title"),
-        "results": job.get("results"),
+        "results": results,
+        "results_total": results_total,
         "raw_output": job.get("raw_output"),
         "error": job.get("error"),
         "metadata": job.get("metadata"),
@@ -193,6 +321,37 @@ async def get_job_status(job_id: str):
     }
 
 
+def _job_etag(job: dict, limit: Optional[int], offset: int) -> str:
+    """
+    Build an ETag for a job status response.
+
+    Jobs only change on status updates, so the status, progress message and
+    completion time identify a version; the page window is included because
+    each page is a different representation.
+
+    Args:
+        job: Job row from the database
+        limit: Requested page size
+        offset: Requested page offset
+
+    Returns:
+        str: Quoted ETag value
+    """
+    version = (
+        f"{job['id']}:{job.get('status', '')}:{job.get('status_message') or ''}:"
+        f"{job.get('completed_at') or ''}:{offset}:{limit}"
+    )
+    return f'"{hashlib.blake2b(version.encode(), digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header (which may list several tags) against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
 @app.post("/api/cancel/{job_id}", tags=["Jobs"])
 async def cancel_job(job_id: str):
     """
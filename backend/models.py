@@ -112,6 +112,7 @@ class JobStatusResponse(BaseModel):
     status_message: Optional[str] = Field(None, description="Current progress message")
     search_title: Optional[str] = Field(None, description="User-friendly job name")
     results: Optional[List[Resource]] = Field(None, description="List of resources (if completed)")
+    results_total: Optional[int] = Field(None, description="Total number of resources before pagination")
     raw_output: Optional[str] = Field(None, description="Raw markdown output from crew")
     error: Optional[str] = Field(None, description="Error message (if failed)")
     metadata: Optional[dict] = Field(None, description="Additional job metadata")
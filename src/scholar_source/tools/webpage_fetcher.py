@@ -3,16 +3,58 @@ Webpage Content Fetcher Tool
 
 Fetches full HTML content from a webpage and returns clean text.
 """
+import hashlib
+import io
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import diskcache
 from crewai.tools import BaseTool
 import requests
-from bs4 import BeautifulSoup
-from typing import Type
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+from typing import Any, ClassVar, Dict, List, Mapping, Optional, Tuple, Type, Union
 from pydantic import BaseModel, Field
 
+# Hard cap on downloaded bytes so oversized or never-ending pages can't pin memory
+MAX_CONTENT_BYTES = 2 * 1024 * 1024  # 2 MB
+CHUNK_SIZE = 64 * 1024
+
+# Only parse responses that are actually HTML (or that don't declare a type)
+ALLOWED_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# On-disk cache of cleaned page text. Entries are fresh for the TTL, then
+# revalidated with a conditional GET; stale copies are kept for the
+# retention period so they can be served when a site is unreachable.
+CACHE_DIR = Path(__file__).parent / ".webcache"
+CACHE_TTL_SECONDS = int(os.getenv('WEBPAGE_CACHE_TTL_SECONDS', '3600'))  # Default: 1 hour
+CACHE_RETENTION_SECONDS = 7 * 24 * 3600
+CACHE_SIZE_LIMIT_BYTES = 256 * 1024 * 1024
+
+# Upper bound on parallel requests when fetching a list of URLs
+MAX_CONCURRENT_FETCHES = 8
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Elements whose text is never useful to the agents
+_SKIP_TAGS = frozenset({"script", "style", "nav", "footer", "header"})
+# String types included in the output (excludes comments, doctypes, etc.)
+_TEXT_TYPES = (NavigableString, CData)
+
+# Whitespace around a newline (including blank lines) collapses to a single newline
+_LINE_BREAK_RE = re.compile(r'[^\S\n]*\n\s*')
+
 
 class WebPageFetcherToolInput(BaseModel):
     """Input schema for WebPageFetcherTool"""
-    url: str = Field(..., description="The URL of the webpage to fetch")
+    url: Union[str, List[str]] = Field(
+        ...,
+        description="The URL of the webpage to fetch, or a list of URLs to fetch concurrently"
+    )
 
 
 class WebPageFetcherTool(BaseTool):
@@ -20,60 +62,268 @@ class WebPageFetcherTool(BaseTool):
     Tool to fetch and extract full text content from a webpage.
 
     This tool:
-    1. Fetches the HTML content from the given URL
-    2. Parses the HTML using BeautifulSoup
-    3. Removes script and style tags
-    4. Returns clean text content
+    1. Fetches the HTML content from the given URL (streamed, capped at 2 MB)
+    2. Parses the HTML using BeautifulSoup with the lxml parser
+    3. Skips script, style and page-chrome (nav/header/footer) tags
+    4. Returns clean text content, cached on disk between calls
+
+    Passing a list of URLs fetches them concurrently (see fetch_many()).
 
     Perfect for extracting course information, textbook details, and syllabus content
     from university course pages.
     """
     name: str = "Webpage Content Fetcher"
     description: str = (
-        "Fetches and returns the full text content of a webpage given its URL. "
+        "Fetches and returns the full text content of a webpage given its URL, "
+        "or of several webpages at once given a list of URLs. "
         "Use this to extract course information, textbook details, and syllabus content. "
         "Returns clean text with scripts and styles removed."
     )
     args_schema: Type[BaseModel] = WebPageFetcherToolInput
 
-    def _run(self, url: str) -> str:
+    # Shared across all tool instances so repeated fetches reuse pooled
+    # TCP/TLS connections instead of handshaking on every call
+    _session: ClassVar[Optional[requests.Session]] = None
+    _init_lock: ClassVar[threading.Lock] = threading.Lock()
+    _cache: ClassVar[Optional[diskcache.Cache]] = None
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """
+        Get the shared HTTP session, creating it on first use.
+
+        Returns:
+            requests.Session: Session with connection pooling and retries
+        """
+        if cls._session is None:
+            with cls._init_lock:
+                if cls._session is None:
+                    retries = Retry(
+                        total=2,
+                        backoff_factor=0.3,
+                        status_forcelist=[429, 500, 502, 503, 504],
+                        raise_on_status=False,  # Surface the final response as an HTTPError
+                        # Retry-After is uncapped in urllib3 and would bypass the request timeouts
+                        respect_retry_after_header=False
+                    )
+                    adapter = HTTPAdapter(
+                        pool_connections=20,
+                        pool_maxsize=50,
+                        max_retries=retries
+                    )
+                    session = requests.Session()
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    session.headers["User-Agent"] = USER_AGENT
+                    cls._session = session
+
+        return cls._session
+
+    @classmethod
+    def _get_cache(cls) -> diskcache.Cache:
+        """
+        Get the shared on-disk page cache, opening it on first use.
+
+        Returns:
+            diskcache.Cache: LRU cache of cleaned page text keyed by URL hash
+        """
+        if cls._cache is None:
+            with cls._init_lock:
+                if cls._cache is None:
+                    cls._cache = diskcache.Cache(
+                        str(CACHE_DIR),
+                        size_limit=CACHE_SIZE_LIMIT_BYTES,
+                        eviction_policy="least-recently-used"
+                    )
+
+        return cls._cache
+
+    def _run(self, url: Union[str, List[str]]) -> str:
+        """
+        Fetch one or more webpages and return their clean text.
+
+        Args:
+            url: The URL of the webpage to fetch, or a list of URLs to fetch
+                concurrently
+
+        Returns:
+            str: Clean text content (one section per URL for a list), or an
+            error message
+        """
+        if isinstance(url, str):
+            return self._fetch(url)
+
+        if not url:
+            return "ERROR: No URLs provided"
+
+        texts = self.fetch_many(url)
+        return "\n\n".join(f"=== {page_url} ===\n{text}" for page_url, text in zip(url, texts))
+
+    def fetch_many(self, urls: List[str]) -> List[str]:
+        """
+        Fetch several webpages concurrently.
+
+        The work is network-bound, so a small thread pool sharing the pooled
+        session brings total wall time close to that of the slowest URL.
+
+        Args:
+            urls: URLs of the webpages to fetch
+
+        Returns:
+            list[str]: Clean text (or error message) for each URL, in order
+        """
+        if not urls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_FETCHES, len(urls))) as executor:
+            return list(executor.map(self._fetch, urls))
+
+    def _fetch(self, url: str) -> str:
         """
         Fetch webpage content and return as clean text.
 
+        Fresh cache entries are returned without touching the network. Stale
+        entries are revalidated with a conditional GET, and served as-is if
+        the site is unreachable.
+
         Args:
             url: The URL of the webpage to fetch
 
         Returns:
             str: Clean text content of the webpage, or an error message
         """
+        cache_key, entry = self._lookup_cache(url)
+
+        if entry and entry["expires_at"] > time.time():
+            return entry["text"]
+
         try:
-            # Fetch the webpage
-            response = requests.get(url, timeout=15, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-            response.raise_for_status()
+            # Fetch the webpage (connect timeout, read timeout)
+            response = self._get_session().get(
+                url, stream=True, timeout=(5, 15), headers=self._revalidation_headers(entry)
+            )
+            with response:
+                if response.status_code == 304 and entry:
+                    self._refresh_cache(cache_key, entry)
+                    return entry["text"]
 
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+                response.raise_for_status()
 
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "footer", "header"]):
-                script.decompose()
+                # A missing Content-Type is treated as HTML; only reject declared non-HTML types
+                content_type = response.headers.get("content-type", "").strip().lower()
+                if content_type and not content_type.startswith(ALLOWED_CONTENT_TYPES):
+                    return f"ERROR: Unsupported content type '{content_type}' at {url}"
 
-            # Get text content
-            text = soup.get_text(separator='\n', strip=True)
+                # Read body in chunks, bailing out once the cap is exceeded
+                content = bytearray()
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    content.extend(chunk)
+                    if len(content) > MAX_CONTENT_BYTES:
+                        return f"ERROR: Page at {url} exceeds {MAX_CONTENT_BYTES // (1024 * 1024)} MB size limit"
 
-            # Clean up excessive whitespace
-            lines = [line.strip() for line in text.split('\n') if line.strip()]
-            cleaned_text = '\n'.join(lines)
+                # Only trust the encoding if the server actually declared one;
+                # otherwise let BeautifulSoup sniff it from the document
+                encoding = response.encoding if "charset=" in content_type else None
 
+            cleaned_text = self._extract_text(bytes(content), encoding)
+            self._store_cache(cache_key, cleaned_text, response.headers)
             return cleaned_text
 
         except requests.exceptions.Timeout:
+            if entry:
+                return entry["text"]  # Serve stale content rather than failing
             return f"ERROR: Request timed out while fetching {url}"
         except requests.exceptions.HTTPError as e:
+            if entry and e.response.status_code >= 500:
+                return entry["text"]
             return f"ERROR: HTTP error {e.response.status_code} while fetching {url}"
+        except requests.exceptions.ConnectionError as e:
+            if entry:
+                return entry["text"]
+            return f"ERROR: Could not fetch {url}: {str(e)}"
         except requests.exceptions.RequestException as e:
             return f"ERROR: Could not fetch {url}: {str(e)}"
         except Exception as e:
             return f"ERROR: Unexpected error while processing {url}: {str(e)}"
+
+    def _lookup_cache(self, url: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Look up a URL in the page cache.
+
+        Args:
+            url: The URL of the webpage
+
+        Returns:
+            tuple: (cache key, cached entry or None if missing or the cache is
+            unavailable)
+        """
+        cache_key = hashlib.blake2b(url.encode()).hexdigest()
+        try:
+            return cache_key, self._get_cache().get(cache_key)
+        except Exception:
+            # Caching is best-effort: an unusable cache means an uncached fetch
+            return cache_key, None
+
+    @staticmethod
+    def _revalidation_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Build conditional GET headers for a stale cache entry."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def _refresh_cache(self, cache_key: str, entry: Dict[str, Any]) -> None:
+        """Extend the freshness of an entry the server reported as unchanged."""
+        entry["expires_at"] = time.time() + CACHE_TTL_SECONDS
+        try:
+            self._get_cache().set(cache_key, entry, expire=CACHE_RETENTION_SECONDS)
+        except Exception:
+            pass  # Best-effort: the cached text is still returned
+
+    def _store_cache(self, cache_key: str, text: str, headers: Mapping[str, str]) -> None:
+        """Store freshly parsed page text along with its validators."""
+        try:
+            self._get_cache().set(cache_key, {
+                "etag": headers.get("etag"),
+                "last_modified": headers.get("last-modified"),
+                "text": text,
+                "expires_at": time.time() + CACHE_TTL_SECONDS
+            }, expire=CACHE_RETENTION_SECONDS)
+        except Exception:
+            pass  # Best-effort: never discard text that was already fetched and parsed
+
+    @staticmethod
+    def _extract_text(content: bytes, encoding: Optional[str] = None) -> str:
+        """
+        Convert raw HTML into clean text.
+
+        Args:
+            content: Raw HTML bytes
+            encoding: Charset declared by the server, if any
+
+        Returns:
+            str: Text content with boilerplate elements and blank lines removed
+        """
+        # Parse HTML from raw bytes (avoids a separate decode pass) using
+        # the C-based lxml parser, which is much faster than html.parser
+        soup = BeautifulSoup(content, 'lxml', from_encoding=encoding)
+
+        # Collect text in a single iterative walk, skipping boilerplate
+        # subtrees instead of decomposing them first (comments, doctypes
+        # and other special strings are ignored, as in get_text)
+        buf = io.StringIO()
+        stack = [soup]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Tag):
+                if node.name not in _SKIP_TAGS:
+                    stack.extend(reversed(node.contents))
+            elif type(node) in _TEXT_TYPES:
+                buf.write(node)
+                buf.write('\n')
+
+        # Clean up excessive whitespace: strip every line and drop blank ones
+        return _LINE_BREAK_RE.sub('\n', buf.getvalue()).strip()
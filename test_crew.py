@@ -1,11 +1,25 @@
 #!/usr/bin/env python
 """Quick test script to verify crew is working with verbose output."""
 import sys
+import types
 import warnings
-from scholar_source.crew import ScholarSource
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
+# Fixed test inputs (read-only; copied per run since kickoff may mutate it)
+_INPUTS = types.MappingProxyType({
+    'university_name': 'Northwestern University',
+    'course_name': 'GEN_ENG 205-2',
+    'course_url': '',
+    'textbook': '',
+    'topics_list': '',
+    'book_title': '',
+    'book_author': '',
+    'isbn': '',
+    'book_pdf_path': '',
+    'book_url': ''
+})
+
 def test_crew():
     print("=" * 60)
     print("Starting ScholarSource Crew Test")
@@ -13,31 +27,21 @@ def test_crew():
     print("\n[INFO] Initializing crew...")
 
     try:
+        # Imported here so importing this module doesn't pay CrewAI's import cost
+        from scholar_source.crew import ScholarSource
+
         crew_instance = ScholarSource()
         print("[INFO] Crew initialized successfully")
 
         print("\n[INFO] Starting crew execution...")
         print("[INFO] This may take 1-5 minutes...\n")
 
-        inputs = {
-            'university_name': 'Northwestern University',
-            'course_name': 'GEN_ENG 205-2',
-            'course_url': '',
-            'textbook': '',
-            'topics_list': '',
-            'book_title': '',
-            'book_author': '',
-            'isbn': '',
-            'book_pdf_path': '',
-            'book_url': ''
-        }
-
-        print(f"[INFO] Inputs: {inputs}\n")
+        print(f"[INFO] Inputs: {dict(_INPUTS)}\n")
 
         # Force stdout flush
         sys.stdout.flush()
 
-        result = crew_instance.crew().kickoff(inputs=inputs)
+        result = crew_instance.crew().kickoff(inputs=dict(_INPUTS))
 
         print("\n" + "=" * 60)
         print("Crew Execution Complete!")